@@ -47,16 +47,14 @@ async def get_current_user(
 
 def require_roles(*roles: Role):
     """Dependency factory to require specific roles."""
+    # Users store their role as a plain string; unknown roles never match
+    allowed_roles = frozenset(role.value for role in roles)
 
     async def role_checker(
         current_user: User = Depends(get_current_user),
     ) -> User:
         """Check if current user has required role."""
-        try:
-            user_role = Role(current_user.role)
-        except ValueError:
-            user_role = None
-        if user_role is None or user_role not in roles:
+        if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=ErrorMessages.NOT_ENOUGH_PERMISSIONS,
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
 from app.core.config import settings
@@ -24,6 +24,8 @@ async def check_database_health() -> str:
     """
     Check database health by executing a simple query.
 
+    Used as a dependency of the health endpoint so tests can override it.
+
     Returns:
         "ok" if database is healthy, "error" otherwise
     """
@@ -58,7 +60,9 @@ async def check_database_health() -> str:
 
 
 @MainRouter.get("/health", response_model=HealthCheckResponse)
-async def health_check() -> HealthCheckResponse:
+async def health_check(
+    db_status: str = Depends(check_database_health),
+) -> HealthCheckResponse:
     """
     Health check endpoint with database status.
 
@@ -67,8 +71,6 @@ async def health_check() -> HealthCheckResponse:
         - status: "ok" if all checks pass, "degraded" if DB is down
         - db: "ok" if database is reachable, "error" otherwise
     """
-    db_status = await check_database_health()
-
     # Overall status is "degraded" if DB is down, "ok" otherwise
     overall_status = "ok" if db_status == "ok" else "degraded"
 
@@ -7,17 +7,38 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
 
+def _json_default(value: Any) -> str:
+    """Serialize values the JSON encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Encode a log payload as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, default=_json_default)
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -56,14 +77,24 @@ class JSONFormatter(logging.Formatter):
             if not key.startswith("_"):
                 log_data[key] = getattr(record, key)
 
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
+
 
+def setup_logging(
+    log_level: str = "INFO",
+    env: str = "dev",
+    logger: logging.Logger | None = None,
+) -> None:
+    """
+    Configure application logging.
 
-def setup_logging(log_level: str = "INFO", env: str = "dev") -> None:
-    """Configure application logging."""
+    Handlers are installed on ``logger`` (the root logger by default). A
+    dedicated logger stops propagating to the root, so its records are not
+    emitted twice, and the third-party logger levels are left untouched.
+    """
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    target_logger = logger or logging.getLogger()
+    target_logger.handlers.clear()
 
     if env.lower() == "production":
         formatter: logging.Formatter = JSONFormatter()
@@ -74,14 +105,18 @@ def setup_logging(log_level: str = "INFO", env: str = "dev") -> None:
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    target_logger.addHandler(console_handler)
 
     file_formatter = JSONFormatter()
     file_handler = logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8")
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    target_logger.addHandler(file_handler)
+
+    target_logger.setLevel(numeric_level)
+    if logger is not None:
+        logger.propagate = False
+        return
 
-    root_logger.setLevel(numeric_level)
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
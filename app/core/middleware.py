@@ -32,38 +32,43 @@ class StructuredLoggingMiddleware(BaseHTTPMiddleware):
         method = request.method
         path = request.url.path
         client_ip = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent")
 
-        logger.info(
-            "Request started",
-            extra={
-                "correlation_id": correlation_id,
-                "method": method,
-                "path": path,
-                "client_ip": client_ip,
-                "user_agent": user_agent,
-                "query_params": str(request.query_params)
-                if request.query_params
-                else None,
-            },
-        )
-
-        try:
-            response = await call_next(request)
-            latency_ms = (time.time() - start_time) * 1000
+        # Skip building the log payloads when INFO is filtered out
+        # (e.g. production running at WARNING)
+        info_enabled = logger.isEnabledFor(logging.INFO)
 
+        if info_enabled:
             logger.info(
-                "Request completed",
+                "Request started",
                 extra={
                     "correlation_id": correlation_id,
                     "method": method,
                     "path": path,
-                    "status_code": response.status_code,
-                    "latency_ms": round(latency_ms, 2),
                     "client_ip": client_ip,
+                    "user_agent": request.headers.get("user-agent"),
+                    "query_params": str(request.query_params)
+                    if request.query_params
+                    else None,
                 },
             )
 
+        try:
+            response = await call_next(request)
+
+            if info_enabled:
+                latency_ms = (time.time() - start_time) * 1000
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "method": method,
+                        "path": path,
+                        "status_code": response.status_code,
+                        "latency_ms": round(latency_ms, 2),
+                        "client_ip": client_ip,
+                    },
+                )
+
             # Add correlation ID to response headers
             response.headers["X-Correlation-ID"] = correlation_id
 
@@ -1,14 +1,54 @@
 """Security utilities."""
 
+import copy
+import hashlib
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from app.core.config import settings
 from app.core.roles import Role
 
 
+class _TokenDecoder(jwt.PyJWT):
+    """PyJWT decoder that parses token payloads with orjson when installed."""
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        """Parse the payload segment of a verified token into a claims dict."""
+        if orjson is None:
+            return super()._decode_payload(decoded)
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_token_decoder = _TokenDecoder()
+
+# Decoded access-token payloads, keyed by a digest of the signing key,
+# algorithm and token. Every authenticated request decodes its bearer token,
+# and clients resend the same token until it expires, so verified payloads are
+# kept for a short while (never past the token's own expiry) to skip the
+# signature check and parsing. Rotating SECRET_KEY or ALGORITHM changes the
+# key, so cached payloads stop matching immediately.
+_ACCESS_TOKEN_CACHE_TTL_SECONDS = 30
+_ACCESS_TOKEN_CACHE_MAX_SIZE = 10_000
+_access_token_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+# Claims every refresh token must carry
+_REFRESH_TOKEN_DECODE_OPTIONS: dict[str, Any] = {"require": ["exp", "sub", "type"]}
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: timedelta | None = None,
@@ -130,22 +170,46 @@ def verify_token_scope(payload: dict[str, Any], required_scope: str) -> bool:
 
 
 def decode_access_token(token: str) -> Any:
-    """Decode a JWT access token."""
+    """Decode a JWT access token, reusing a recent result for the same token."""
+    secret = str(settings.SECRET_KEY)
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (secret, settings.ALGORITHM, token):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    key = digest.digest()
+    now = time.time()
+    cached = _access_token_cache.get(key)
+    if cached is not None:
+        valid_until, payload = cached
+        if now < valid_until:
+            # Deep copy: claims such as scopes are lists callers may mutate
+            return copy.deepcopy(payload)
+        del _access_token_cache[key]
+
     try:
-        payload = jwt.decode(token, str(settings.SECRET_KEY), algorithms=[settings.ALGORITHM])
-        # If subject was stored as a string, convert numeric subject back to int
-        sub = payload.get("sub")
-        if isinstance(sub, str) and sub.isdigit():
-            try:
-                payload["sub"] = int(sub)
-            except Exception:
-                # leave as-is if conversion fails
-                pass
-        return payload
+        payload = _token_decoder.decode(token, secret, algorithms=[settings.ALGORITHM])
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
         return None
 
-
+    # If subject was stored as a string, convert numeric subject back to int
+    sub = payload.get("sub")
+    if isinstance(sub, str) and sub.isdigit():
+        try:
+            payload["sub"] = int(sub)
+        except Exception:
+            # leave as-is if conversion fails
+            pass
+
+    # Tokens without an expiry claim are never cached
+    if "exp" in payload:
+        if len(_access_token_cache) >= _ACCESS_TOKEN_CACHE_MAX_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _access_token_cache[next(iter(_access_token_cache))]
+        _access_token_cache[key] = (
+            min(now + _ACCESS_TOKEN_CACHE_TTL_SECONDS, payload["exp"]),
+            payload,
+        )
+    return copy.deepcopy(payload)
 
 
 def create_refresh_token(
@@ -169,18 +233,23 @@ def create_refresh_token(
 def decode_refresh_token(token: str) -> Any:
     """Decode a JWT refresh token."""
     try:
-        payload = jwt.decode(
-            token, str(settings.SECRET_KEY), algorithms=[settings.ALGORITHM]
+        # One decode validates the signature and that every claim we rely on
+        # is present (PyJWT raises MissingRequiredClaimError otherwise)
+        payload = _token_decoder.decode(
+            token,
+            str(settings.SECRET_KEY),
+            algorithms=[settings.ALGORITHM],
+            options=_REFRESH_TOKEN_DECODE_OPTIONS,
         )
-        # normalize subject type if present
-        sub = payload.get("sub")
+        if payload["type"] != "refresh":
+            return None
+        # normalize subject type
+        sub = payload["sub"]
         if isinstance(sub, str) and sub.isdigit():
             try:
                 payload["sub"] = int(sub)
             except Exception:
                 pass
-        if payload.get("type") != "refresh":
-            return None
         return payload
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
         return None
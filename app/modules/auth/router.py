@@ -16,6 +16,7 @@ from app.modules.auth.schema import (
     LoginRequest,
     RefreshRequest,
     SignupRequest,
+    SignupResponse,
     TokenResponse,
 )
 from app.modules.user.model import User
@@ -42,7 +43,7 @@ def _create_tokens(user: User) -> TokenResponse:
 
 @AuthRouter.post(
     "/signup",
-    response_model=TokenResponse,
+    response_model=SignupResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user",
     description="Create a new user account. Available roles: consumer, supplier_owner. Password must meet policy requirements. Rate limited to 10 requests per minute.",
@@ -127,7 +128,7 @@ async def signup(
             detail=ErrorMessages.FAILED_TO_CREATE_USER,
         )
 
-    return _create_tokens(user)
+    return SignupResponse(**_create_tokens(user).model_dump(), user_id=user.id)
 
 
 @AuthRouter.post(
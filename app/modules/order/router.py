@@ -5,7 +5,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.dependencies import get_current_user
 from app.core.constants import ErrorMessages
@@ -223,7 +223,9 @@ async def get_orders(
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """Get orders (consumer: own orders, supplier staff: their supplier's orders)."""
-    query = select(Order).options(selectinload(Order.items))
+    # Items are the only relationship the response reads; any other lazy load
+    # would be one extra SELECT per order, so make it an error instead
+    query = select(Order).options(selectinload(Order.items), raiseload("*"))
     consumer_id: int | None = None
     supplier_id: int | None = None
 
@@ -5,6 +5,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.api.dependencies import get_current_user
 from app.core.constants import ErrorMessages
@@ -243,8 +244,9 @@ async def get_products(
 
     **Pagination:** Results are paginated with max page size of 100.
     """
-    # Build query
-    query = select(Product)
+    # Build query; the response only reads columns, so forbid lazy loads that
+    # would issue a SELECT per product
+    query = select(Product).options(raiseload("*"))
     if supplier_id:
         query = query.where(Product.supplier_id == supplier_id)
     if is_active is not None:
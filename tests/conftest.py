@@ -1,10 +1,14 @@
 """Pytest configuration and fixtures."""
 
-from collections.abc import AsyncGenerator
+import os
+from collections.abc import AsyncGenerator, Callable
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -16,8 +20,61 @@ from app.core.config import settings
 from app.db.session import get_db
 from app.main import app
 
+# Use bcrypt's minimum cost factor: hash strength is irrelevant in tests, and
+# signup/login hash or verify a password on every call. Set before importing
+# the fixtures so their precomputed password hash uses it too.
+settings.BCRYPT_ROUNDS = 4
+
+from tests.fixtures import bearer  # noqa: E402
+
+# pytest-xdist worker id (gw0, gw1, ...), or None when running in a single process
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
 # Use test database URL if available, otherwise fall back to regular database URL
-TEST_DATABASE_URL = settings.TEST_DATABASE_URL or settings.DATABASE_URL
+BASE_TEST_DATABASE_URL = settings.TEST_DATABASE_URL or settings.DATABASE_URL
+
+
+def _worker_database_url(url: str) -> str:
+    """Suffix the database name with the xdist worker id so workers don't share data."""
+    if not XDIST_WORKER:
+        return url
+    parsed = make_url(url)
+    return parsed.set(database=f"{parsed.database}_{XDIST_WORKER}").render_as_string(
+        hide_password=False
+    )
+
+
+# Under pytest-xdist each worker runs against its own copy of the test database
+TEST_DATABASE_URL = _worker_database_url(BASE_TEST_DATABASE_URL)
+
+
+async def _execute_on_server(*statements: str) -> None:
+    """Run statements that can't run inside a transaction (CREATE/DROP DATABASE)."""
+    admin_engine = create_async_engine(
+        make_url(BASE_TEST_DATABASE_URL).set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    async with admin_engine.connect() as connection:
+        for statement in statements:
+            await connection.execute(text(statement))
+    await admin_engine.dispose()
+
+
+async def _clone_worker_database() -> None:
+    """
+    Recreate the worker database from the migrated test database.
+
+    The test database is used as a template, so Postgres copies it at the
+    file level instead of replaying migrations. Nothing else may be connected
+    to the template while it is copied.
+    """
+    template = make_url(BASE_TEST_DATABASE_URL).database
+    worker_database = make_url(TEST_DATABASE_URL).database
+    await _execute_on_server(
+        f'DROP DATABASE IF EXISTS "{worker_database}"',
+        f'CREATE DATABASE "{worker_database}" TEMPLATE "{template}"',
+    )
 
 
 @pytest.fixture(scope="session")
@@ -26,55 +83,110 @@ async def test_engine() -> AsyncGenerator[AsyncEngine]:
     Create a test database engine (session-scoped).
 
     This engine is created once per test session and reused across all tests.
-    Using NullPool to avoid connection reuse issues in tests.
+    Connections are pooled (tests and fixtures share one event loop), so
+    asyncpg's prepared statement caches survive from one test to the next.
+    Under pytest-xdist the worker's database is cloned from the test database
+    and dropped at the end.
     """
+    if XDIST_WORKER:
+        await _clone_worker_database()
+
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,  # Disable SQL logging in tests unless debugging
-        poolclass=NullPool,  # No connection pooling for tests
+        pool_size=5,
+        max_overflow=0,
+        connect_args={
+            # asyncpg's own statement cache and SQLAlchemy's prepared statement
+            # cache for the asyncpg dialect (both default to 100)
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 1024,
+        },
     )
 
     yield engine
 
     # Cleanup: dispose engine after all tests complete
     await engine.dispose()
+    if XDIST_WORKER:
+        worker_database = make_url(TEST_DATABASE_URL).database
+        await _execute_on_server(f'DROP DATABASE IF EXISTS "{worker_database}"')
 
 
-@pytest.fixture
-async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
+@pytest.fixture(scope="session")
+async def db_connection(test_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection]:
     """
-    Create a test database session with automatic rollback.
+    Open the test database connection (session-scoped).
 
-    Each test gets its own transaction that's rolled back after the test,
-    ensuring test isolation and keeping the database clean.
+    All tests run on this one connection inside a single outer transaction
+    that is rolled back at the end of the session, so nothing a test writes
+    is ever committed.
     """
     async with test_engine.connect() as connection:
-        # Start a transaction
         transaction = await connection.begin()
+        yield connection
+        await transaction.rollback()
 
-        # Create a session bound to this connection
-        TestSessionLocal = async_sessionmaker(
-            bind=connection,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
 
-        async with TestSessionLocal() as session:
-            yield session
-            # Rollback to undo all changes made in this test
-            await session.rollback()
+@pytest.fixture
+async def db_session(db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession]:
+    """
+    Create a test database session with automatic rollback.
 
-        # Rollback the outer transaction
-        await transaction.rollback()
+    Each test runs inside its own SAVEPOINT on the shared connection, rolled
+    back after the test, ensuring test isolation and keeping the database
+    clean. The session nests a further SAVEPOINT, so a commit or rollback
+    issued by the app only ends that inner savepoint and never the test's.
+    """
+    test_savepoint = await db_connection.begin_nested()
+
+    # Create a session bound to the shared connection
+    TestSessionLocal = async_sessionmaker(
+        bind=db_connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    async with TestSessionLocal() as session:
+        yield session
+
+    # Rollback to undo all changes made in this test
+    await test_savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """
+    Create the in-process ASGI transport for the FastAPI app (session-scoped).
+
+    Requests are dispatched straight to the app, with no socket or TLS setup.
+    Every test client shares this one transport.
+    """
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+async def http_client(asgi_transport: ASGITransport) -> AsyncGenerator[AsyncClient]:
+    """
+    Create the HTTP client for the FastAPI app (session-scoped).
+
+    The client is built once and shared by every test; per-test state
+    (database override, cookies) is reset by the ``client`` fixture.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient]:
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient]:
     """
-    Create a test HTTP client with database session override.
+    Provide the shared test HTTP client with database session override.
 
-    This fixture provides an AsyncClient that can make requests to the FastAPI app.
-    The database dependency is overridden to use the test session.
+    The database dependency is overridden to use the test session, so requests
+    see (and roll back with) the data created by the test.
     """
 
     async def override_get_db() -> AsyncGenerator[AsyncSession]:
@@ -84,13 +196,39 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient]:
     # Override the database dependency
     app.dependency_overrides[get_db] = override_get_db
 
-    # Create test client
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield http_client
 
-    # Cleanup: remove dependency overrides after test
+    # Cleanup: remove dependency overrides and any cookies set by the test
     app.dependency_overrides.clear()
+    http_client.cookies.clear()
+
+
+@pytest.fixture
+async def authed_client(
+    client: AsyncClient, asgi_transport: ASGITransport
+) -> AsyncGenerator[Callable[[str], AsyncClient]]:
+    """
+    Build HTTP clients that send a fixed bearer token on every request.
+
+    Each derived client talks to the same app (and database override) as
+    ``client`` but carries its own ``Authorization`` header, so tests don't
+    rebuild a headers dict for every request.
+    """
+    authed_clients: list[AsyncClient] = []
+
+    def _make(token: str) -> AsyncClient:
+        authed = AsyncClient(
+            transport=asgi_transport,
+            base_url=client.base_url,
+            headers=bearer(token),
+        )
+        authed_clients.append(authed)
+        return authed
+
+    yield _make
+
+    for authed in authed_clients:
+        await authed.aclose()
 
 
 # Import all fixtures from fixtures module
@@ -104,7 +242,15 @@ from tests.fixtures import (  # noqa: E402, F401
     chat_session,
     complaint,
     consumer,
+    consumer_token,
     consumer_user,
+    make_consumer,
+    make_link,
+    make_order,
+    make_product,
+    make_staff,
+    make_supplier,
+    make_user,
     notification,
     order,
     pending_link,
@@ -112,6 +258,7 @@ from tests.fixtures import (  # noqa: E402, F401
     supplier,
     supplier_manager_staff,
     supplier_manager_user,
+    supplier_owner_token,
     supplier_owner_user,
     supplier_sales_staff,
     supplier_sales_user,
@@ -1,13 +1,16 @@
 """Comprehensive test fixtures for users, roles, and sample data."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from decimal import Decimal
+from typing import Any
 
 import pytest
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from app.core.roles import Role
+from app.core.security import create_access_token
 from app.modules.chat.model import ChatSession
 from app.modules.complaint.model import Complaint, ComplaintStatus
 from app.modules.consumer.model import Consumer
@@ -19,19 +22,94 @@ from app.modules.supplier.model import Supplier, SupplierStaff
 from app.modules.user.model import User
 from app.utils.hashing import hash_password
 
+# Password used for every test account; it satisfies the password policy.
+# Hashed once at import so fixtures don't pay for bcrypt on every user.
+TEST_PASSWORD = "Password123"
+TEST_PASSWORD_HASH = hash_password(TEST_PASSWORD)
+
+# Default price / order total for factory-built rows
+DEFAULT_PRICE_KZT = Decimal("1000.00")
+
+
+def bearer(token: str) -> dict[str, str]:
+    """Return the Authorization header for a bearer token."""
+    return {"Authorization": "Bearer " + token}
+
+
+def issue_token(user: User) -> str:
+    """Issue an access token for a user without going through login."""
+    return create_access_token(
+        data={"sub": user.id, "email": user.email, "role": user.role}
+    )
+
+
+@contextmanager
+def count_queries(connection: AsyncConnection) -> Iterator[list[str]]:
+    """Collect the SQL statements run on ``connection`` inside the block.
+
+    SAVEPOINT bookkeeping from the test session is left out, so the list holds
+    only the queries the code under test issued.
+    """
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if "SAVEPOINT" not in statement:
+            statements.append(statement)
+
+    sync_connection = connection.sync_connection
+    event.listen(sync_connection, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_connection, "before_cursor_execute", _record)
+
+
+async def seed_notifications(
+    db_session: AsyncSession, recipient_id: int, specs: list[dict[str, Any]]
+) -> None:
+    """Insert notifications for a recipient in a single bulk INSERT."""
+    await db_session.execute(
+        insert(Notification),
+        [{"recipient_id": recipient_id, **spec} for spec in specs],
+    )
+
+
+async def seed_products(
+    db_session: AsyncSession, supplier: Supplier, specs: list[dict[str, Any]]
+) -> list[Product]:
+    """Insert products for a supplier in one bulk INSERT ... RETURNING.
+
+    Each spec needs ``sku`` and ``name``; the remaining columns default to the
+    same values as ``make_product``. Products come back in ``specs`` order.
+    """
+    result = await db_session.scalars(
+        insert(Product).returning(Product, sort_by_parameter_order=True),
+        [
+            {
+                "supplier_id": supplier.id,
+                "price_kzt": DEFAULT_PRICE_KZT,
+                "currency": "KZT",
+                "stock_qty": 10,
+                "is_active": True,
+                **spec,
+            }
+            for spec in specs
+        ],
+    )
+    return list(result)
+
 
 @pytest.fixture
 async def consumer_user(db_session: AsyncSession) -> AsyncGenerator[User]:
     """Create a consumer user for testing."""
     user = User(
         email="consumer@test.com",
-        password_hash=hash_password("Password123"),
+        password_hash=TEST_PASSWORD_HASH,
         role=Role.CONSUMER.value,
         is_active=True,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
@@ -45,23 +123,27 @@ async def consumer(
         organization_name="Test Consumer Org",
     )
     db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
+    await db_session.flush()
     return consumer
 
 
+@pytest.fixture
+def consumer_token(consumer_user: User) -> str:
+    """Access token for the consumer user."""
+    return issue_token(consumer_user)
+
+
 @pytest.fixture
 async def supplier_owner_user(db_session: AsyncSession) -> AsyncGenerator[User]:
     """Create a supplier owner user for testing."""
     user = User(
         email="supplier.owner@test.com",
-        password_hash=hash_password("Password123"),
+        password_hash=TEST_PASSWORD_HASH,
         role=Role.SUPPLIER_OWNER.value,
         is_active=True,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
@@ -76,23 +158,27 @@ async def supplier(
         is_active=True,
     )
     db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
+    await db_session.flush()
     return supplier
 
 
+@pytest.fixture
+def supplier_owner_token(supplier_owner_user: User) -> str:
+    """Access token for the supplier owner user."""
+    return issue_token(supplier_owner_user)
+
+
 @pytest.fixture
 async def supplier_manager_user(db_session: AsyncSession) -> AsyncGenerator[User]:
     """Create a supplier manager user for testing."""
     user = User(
         email="supplier.manager@test.com",
-        password_hash=hash_password("Password123"),
+        password_hash=TEST_PASSWORD_HASH,
         role=Role.SUPPLIER_MANAGER.value,
         is_active=True,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
@@ -109,8 +195,7 @@ async def supplier_manager_staff(
         staff_role="manager",
     )
     db_session.add(staff)
-    await db_session.commit()
-    await db_session.refresh(staff)
+    await db_session.flush()
     return staff
 
 
@@ -119,13 +204,12 @@ async def supplier_sales_user(db_session: AsyncSession) -> AsyncGenerator[User]:
     """Create a supplier sales user for testing."""
     user = User(
         email="supplier.sales@test.com",
-        password_hash=hash_password("Password123"),
+        password_hash=TEST_PASSWORD_HASH,
         role=Role.SUPPLIER_SALES.value,
         is_active=True,
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     return user
 
 
@@ -142,8 +226,7 @@ async def supplier_sales_staff(
         staff_role="sales",
     )
     db_session.add(staff)
-    await db_session.commit()
-    await db_session.refresh(staff)
+    await db_session.flush()
     return staff
 
 
@@ -163,8 +246,7 @@ async def product(
         is_active=True,
     )
     db_session.add(product)
-    await db_session.commit()
-    await db_session.refresh(product)
+    await db_session.flush()
     return product
 
 
@@ -181,8 +263,7 @@ async def accepted_link(
         status=LinkStatus.ACCEPTED,
     )
     db_session.add(link)
-    await db_session.commit()
-    await db_session.refresh(link)
+    await db_session.flush()
     return link
 
 
@@ -199,11 +280,160 @@ async def pending_link(
         status=LinkStatus.PENDING,
     )
     db_session.add(link)
-    await db_session.commit()
-    await db_session.refresh(link)
+    await db_session.flush()
     return link
 
 
+@pytest.fixture
+def make_user(db_session: AsyncSession) -> Callable[..., Awaitable[tuple[User, str]]]:
+    """Return a factory that inserts a user and issues its access token.
+
+    Skips the signup endpoint (and its password hashing), so no consumer
+    profile is created for consumer users.
+    """
+
+    async def _make(email: str, role: str) -> tuple[User, str]:
+        user = User(
+            email=email,
+            password_hash=TEST_PASSWORD_HASH,
+            role=role,
+            is_active=True,
+        )
+        db_session.add(user)
+        await db_session.flush()
+        return user, issue_token(user)
+
+    return _make
+
+
+@pytest.fixture
+def make_consumer(
+    db_session: AsyncSession,
+    make_user: Callable[..., Awaitable[tuple[User, str]]],
+) -> Callable[..., Awaitable[tuple[Consumer, str]]]:
+    """Return a factory that inserts a consumer user and profile, with a token."""
+
+    async def _make(
+        email: str, organization_name: str = "Test Consumer Org"
+    ) -> tuple[Consumer, str]:
+        user, token = await make_user(email, Role.CONSUMER.value)
+        consumer = Consumer(user_id=user.id, organization_name=organization_name)
+        db_session.add(consumer)
+        await db_session.flush()
+        return consumer, token
+
+    return _make
+
+
+@pytest.fixture
+def make_supplier(
+    db_session: AsyncSession,
+    make_user: Callable[..., Awaitable[tuple[User, str]]],
+) -> Callable[..., Awaitable[tuple[Supplier, str]]]:
+    """Return a factory that inserts a supplier owner and supplier, with a token."""
+
+    async def _make(
+        email: str, company_name: str = "Test Supplier Co"
+    ) -> tuple[Supplier, str]:
+        user, token = await make_user(email, Role.SUPPLIER_OWNER.value)
+        supplier = Supplier(user_id=user.id, company_name=company_name, is_active=True)
+        db_session.add(supplier)
+        await db_session.flush()
+        return supplier, token
+
+    return _make
+
+
+@pytest.fixture
+def make_staff(
+    db_session: AsyncSession,
+    make_user: Callable[..., Awaitable[tuple[User, str]]],
+) -> Callable[..., Awaitable[tuple[User, str]]]:
+    """Return a factory that inserts a supplier staff user, with a token."""
+
+    async def _make(
+        supplier: Supplier, email: str, staff_role: str = "sales"
+    ) -> tuple[User, str]:
+        role = Role.SUPPLIER_MANAGER if staff_role == "manager" else Role.SUPPLIER_SALES
+        user, token = await make_user(email, role.value)
+        staff = SupplierStaff(
+            user_id=user.id, supplier_id=supplier.id, staff_role=staff_role
+        )
+        db_session.add(staff)
+        await db_session.flush()
+        return user, token
+
+    return _make
+
+
+@pytest.fixture
+def make_link(db_session: AsyncSession) -> Callable[..., Awaitable[Link]]:
+    """Return a factory that inserts a link between a consumer and a supplier."""
+
+    async def _make(
+        consumer: Consumer,
+        supplier: Supplier,
+        status: LinkStatus = LinkStatus.PENDING,
+    ) -> Link:
+        link = Link(consumer_id=consumer.id, supplier_id=supplier.id, status=status)
+        db_session.add(link)
+        await db_session.flush()
+        return link
+
+    return _make
+
+
+@pytest.fixture
+def make_product(db_session: AsyncSession) -> Callable[..., Awaitable[Product]]:
+    """Return a factory that inserts a product for a supplier."""
+
+    async def _make(
+        supplier: Supplier,
+        sku: str,
+        name: str = "Product",
+        price_kzt: Decimal = DEFAULT_PRICE_KZT,
+        stock_qty: int = 10,
+        is_active: bool = True,
+    ) -> Product:
+        product = Product(
+            supplier_id=supplier.id,
+            name=name,
+            price_kzt=price_kzt,
+            currency="KZT",
+            sku=sku,
+            stock_qty=stock_qty,
+            is_active=is_active,
+        )
+        db_session.add(product)
+        await db_session.flush()
+        return product
+
+    return _make
+
+
+@pytest.fixture
+def make_order(db_session: AsyncSession) -> Callable[..., Awaitable[Order]]:
+    """Return a factory that inserts an order (without items)."""
+
+    async def _make(
+        consumer: Consumer,
+        supplier: Supplier,
+        status: OrderStatus = OrderStatus.PENDING,
+        total_kzt: Decimal = DEFAULT_PRICE_KZT,
+    ) -> Order:
+        order = Order(
+            supplier_id=supplier.id,
+            consumer_id=consumer.id,
+            status=status,
+            total_kzt=total_kzt,
+        )
+        db_session.add(order)
+        await db_session.flush()
+        return order
+
+    return _make
+
+
 @pytest.fixture
 async def order(
     consumer: Consumer,
@@ -231,8 +461,7 @@ async def order(
     )
     db_session.add(item1)
 
-    await db_session.commit()
-    await db_session.refresh(order)
+    await db_session.flush()
     return order
 
 
@@ -250,8 +479,7 @@ async def chat_session(
         order_id=order.id,
     )
     db_session.add(session)
-    await db_session.commit()
-    await db_session.refresh(session)
+    await db_session.flush()
     return session
 
 
@@ -273,8 +501,7 @@ async def complaint(
         description="Test complaint description",
     )
     db_session.add(complaint)
-    await db_session.commit()
-    await db_session.refresh(complaint)
+    await db_session.flush()
     return complaint
 
 
@@ -291,67 +518,29 @@ async def notification(
         is_read=False,
     )
     db_session.add(notification)
-    await db_session.commit()
-    await db_session.refresh(notification)
+    await db_session.flush()
     return notification
 
 
 @pytest.fixture
-async def auth_headers_consumer(
-    client: AsyncClient,
-    consumer_user: User,
-) -> AsyncGenerator[dict[str, str]]:
+def auth_headers_consumer(consumer_user: User) -> dict[str, str]:
     """Get authentication headers for consumer user."""
-    # Login to get token
-    login_data = {
-        "email": consumer_user.email,
-        "password": "Password123",
-    }
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return bearer(issue_token(consumer_user))
 
 
 @pytest.fixture
-async def auth_headers_supplier_owner(
-    client: AsyncClient,
-    supplier_owner_user: User,
-) -> AsyncGenerator[dict[str, str]]:
+def auth_headers_supplier_owner(supplier_owner_user: User) -> dict[str, str]:
     """Get authentication headers for supplier owner user."""
-    login_data = {
-        "email": supplier_owner_user.email,
-        "password": "Password123",
-    }
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return bearer(issue_token(supplier_owner_user))
 
 
 @pytest.fixture
-async def auth_headers_supplier_manager(
-    client: AsyncClient,
-    supplier_manager_user: User,
-) -> AsyncGenerator[dict[str, str]]:
+def auth_headers_supplier_manager(supplier_manager_user: User) -> dict[str, str]:
     """Get authentication headers for supplier manager user."""
-    login_data = {
-        "email": supplier_manager_user.email,
-        "password": "Password123",
-    }
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return bearer(issue_token(supplier_manager_user))
 
 
 @pytest.fixture
-async def auth_headers_supplier_sales(
-    client: AsyncClient,
-    supplier_sales_user: User,
-) -> AsyncGenerator[dict[str, str]]:
+def auth_headers_supplier_sales(supplier_sales_user: User) -> dict[str, str]:
     """Get authentication headers for supplier sales user."""
-    login_data = {
-        "email": supplier_sales_user.email,
-        "password": "Password123",
-    }
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return bearer(issue_token(supplier_sales_user))
@@ -4,7 +4,6 @@ import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_cannot_create_product(
     client: AsyncClient,
@@ -25,7 +24,6 @@ async def test_consumer_cannot_create_product(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_owner_can_create_product(
     client: AsyncClient,
@@ -48,7 +46,6 @@ async def test_supplier_owner_can_create_product(
     assert response.json()["name"] == "New Product"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_manager_can_create_product(
     client: AsyncClient,
@@ -69,7 +66,6 @@ async def test_supplier_manager_can_create_product(
     assert response.status_code == 201
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_sales_cannot_create_product(
     client: AsyncClient,
@@ -90,7 +86,6 @@ async def test_supplier_sales_cannot_create_product(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_can_only_see_own_orders(
     client: AsyncClient,
@@ -106,7 +101,6 @@ async def test_consumer_can_only_see_own_orders(
     assert response.json()["id"] == order.id
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_owner_can_see_supplier_orders(
     client: AsyncClient,
@@ -121,7 +115,6 @@ async def test_supplier_owner_can_see_supplier_orders(
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_cannot_update_order_status(
     client: AsyncClient,
@@ -137,7 +130,6 @@ async def test_consumer_cannot_update_order_status(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_owner_can_update_order_status(
     client: AsyncClient,
@@ -153,7 +145,6 @@ async def test_supplier_owner_can_update_order_status(
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_can_create_link_request(
     client: AsyncClient,
@@ -169,7 +160,6 @@ async def test_consumer_can_create_link_request(
     assert response.status_code == 201
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_owner_cannot_create_link_request(
     client: AsyncClient,
@@ -185,7 +175,6 @@ async def test_supplier_owner_cannot_create_link_request(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_owner_can_update_link_status(
     client: AsyncClient,
@@ -201,7 +190,6 @@ async def test_supplier_owner_can_update_link_status(
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_cannot_update_link_status(
     client: AsyncClient,
@@ -217,7 +205,6 @@ async def test_consumer_cannot_update_link_status(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_can_create_complaint(
     client: AsyncClient,
@@ -240,7 +227,6 @@ async def test_consumer_can_create_complaint(
     assert response.status_code == 201
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_supplier_sales_can_update_complaint_status(
     client: AsyncClient,
@@ -256,7 +242,6 @@ async def test_supplier_sales_can_update_complaint_status(
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_consumer_cannot_update_complaint_status(
     client: AsyncClient,
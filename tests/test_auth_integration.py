@@ -1,10 +1,10 @@
 """Integration tests for authentication endpoints."""
 
-import pytest
 from httpx import AsyncClient
 
+from tests.fixtures import bearer
+
 
-@pytest.mark.asyncio
 async def test_signup_creates_user_and_returns_tokens(client: AsyncClient) -> None:
     """Test that signup creates a user and returns access/refresh tokens."""
     signup_data = {
@@ -23,8 +23,16 @@ async def test_signup_creates_user_and_returns_tokens(client: AsyncClient) -> No
     assert len(data["access_token"]) > 0
     assert len(data["refresh_token"]) > 0
 
+    # user_id is the id of the account the issued token authenticates
+    me_response = await client.get(
+        "/api/v1/users/me", headers=bearer(data["access_token"])
+    )
+    assert me_response.status_code == 200
+    me_data = me_response.json()
+    assert me_data["email"] == signup_data["email"]
+    assert data["user_id"] == me_data["id"]
+
 
-@pytest.mark.asyncio
 async def test_signup_duplicate_email_returns_400(client: AsyncClient) -> None:
     """Test that signup with duplicate email returns 400."""
     signup_data = {
@@ -43,7 +51,6 @@ async def test_signup_duplicate_email_returns_400(client: AsyncClient) -> None:
     assert "already registered" in response2.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_login_valid_credentials_returns_tokens(client: AsyncClient) -> None:
     """Test that login with valid credentials returns tokens."""
     # First create a user
@@ -69,7 +76,6 @@ async def test_login_valid_credentials_returns_tokens(client: AsyncClient) -> No
     assert data["token_type"] == "bearer"
 
 
-@pytest.mark.asyncio
 async def test_login_invalid_email_returns_401(client: AsyncClient) -> None:
     """Test that login with invalid email returns 401."""
     login_data = {
@@ -80,13 +86,10 @@ async def test_login_invalid_email_returns_401(client: AsyncClient) -> None:
     response = await client.post("/api/v1/auth/login", json=login_data)
 
     assert response.status_code == 401
-    assert (
-        "incorrect" in response.json()["detail"].lower()
-        or "invalid" in response.json()["detail"].lower()
-    )
+    detail = response.json()["detail"].lower()
+    assert "incorrect" in detail or "invalid" in detail
 
 
-@pytest.mark.asyncio
 async def test_login_invalid_password_returns_401(client: AsyncClient) -> None:
     """Test that login with invalid password returns 401."""
     # First create a user
@@ -106,13 +109,10 @@ async def test_login_invalid_password_returns_401(client: AsyncClient) -> None:
     response = await client.post("/api/v1/auth/login", json=login_data)
 
     assert response.status_code == 401
-    assert (
-        "incorrect" in response.json()["detail"].lower()
-        or "invalid" in response.json()["detail"].lower()
-    )
+    detail = response.json()["detail"].lower()
+    assert "incorrect" in detail or "invalid" in detail
 
 
-@pytest.mark.asyncio
 async def test_refresh_token_returns_new_tokens(client: AsyncClient) -> None:
     """Test that refresh endpoint returns new access and refresh tokens."""
     # Create user and get tokens
@@ -140,7 +140,7 @@ async def test_refresh_token_returns_new_tokens(client: AsyncClient) -> None:
     # Verify tokens are valid by using the new access token
     me_response = await client.get(
         "/api/v1/users/me",
-        headers={"Authorization": f"Bearer {data['access_token']}"},
+        headers=bearer(data["access_token"]),
     )
     assert me_response.status_code == 200
     me_data = me_response.json()
@@ -150,7 +150,6 @@ async def test_refresh_token_returns_new_tokens(client: AsyncClient) -> None:
     # but the important thing is that refresh works and returns valid tokens
 
 
-@pytest.mark.asyncio
 async def test_refresh_invalid_token_returns_401(client: AsyncClient) -> None:
     """Test that refresh with invalid token returns 401."""
     refresh_data = {
@@ -160,13 +159,10 @@ async def test_refresh_invalid_token_returns_401(client: AsyncClient) -> None:
     response = await client.post("/api/v1/auth/refresh", json=refresh_data)
 
     assert response.status_code == 401
-    assert (
-        "invalid" in response.json()["detail"].lower()
-        or "refresh" in response.json()["detail"].lower()
-    )
+    detail = response.json()["detail"].lower()
+    assert "invalid" in detail or "refresh" in detail
 
 
-@pytest.mark.asyncio
 async def test_refresh_access_token_returns_401(client: AsyncClient) -> None:
     """Test that using access token as refresh token returns 401."""
     # Create user and get tokens
@@ -188,7 +184,6 @@ async def test_refresh_access_token_returns_401(client: AsyncClient) -> None:
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_me_endpoint_requires_authentication(client: AsyncClient) -> None:
     """Test that /me endpoint requires authentication."""
     response = await client.get("/api/v1/users/me")
@@ -196,7 +191,6 @@ async def test_me_endpoint_requires_authentication(client: AsyncClient) -> None:
     assert response.status_code == 403  # FastAPI returns 403 for missing auth
 
 
-@pytest.mark.asyncio
 async def test_me_endpoint_returns_user_with_valid_token(client: AsyncClient) -> None:
     """Test that /me endpoint returns user data with valid token."""
     # Create user and get tokens
@@ -209,7 +203,7 @@ async def test_me_endpoint_returns_user_with_valid_token(client: AsyncClient) ->
     tokens = signup_response.json()
 
     # Use access token to get user info
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    headers = bearer(tokens["access_token"])
     response = await client.get("/api/v1/users/me", headers=headers)
 
     assert response.status_code == 200
@@ -221,7 +215,6 @@ async def test_me_endpoint_returns_user_with_valid_token(client: AsyncClient) ->
     assert "created_at" in data
 
 
-@pytest.mark.asyncio
 async def test_me_endpoint_invalid_token_returns_401(client: AsyncClient) -> None:
     """Test that /me endpoint returns 401 with invalid token."""
     headers = {"Authorization": "Bearer invalid.token.here"}
@@ -230,7 +223,6 @@ async def test_me_endpoint_invalid_token_returns_401(client: AsyncClient) -> Non
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_full_auth_flow(client: AsyncClient) -> None:
     """Test complete authentication flow: signup -> login -> refresh -> me."""
     # 1. Signup
@@ -252,7 +244,7 @@ async def test_full_auth_flow(client: AsyncClient) -> None:
     login_tokens = login_response.json()
 
     # 3. Use access token to get /me
-    headers = {"Authorization": f"Bearer {login_tokens['access_token']}"}
+    headers = bearer(login_tokens["access_token"])
     me_response = await client.get("/api/v1/users/me", headers=headers)
     assert me_response.status_code == 200
     user_data = me_response.json()
@@ -265,7 +257,7 @@ async def test_full_auth_flow(client: AsyncClient) -> None:
     refresh_tokens = refresh_response.json()
 
     # 5. Use new access token to get /me
-    new_headers = {"Authorization": f"Bearer {refresh_tokens['access_token']}"}
+    new_headers = bearer(refresh_tokens["access_token"])
     new_me_response = await client.get("/api/v1/users/me", headers=new_headers)
     assert new_me_response.status_code == 200
     new_user_data = new_me_response.json()
@@ -1,156 +1,65 @@
 """Integration tests for complaint endpoints."""
 
-import pytest
+from collections.abc import Awaitable, Callable
+
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.roles import Role
 from app.modules.complaint.model import ComplaintStatus
 from app.modules.consumer.model import Consumer
-from app.modules.order.model import Order, OrderStatus
-from app.modules.supplier.model import Supplier, SupplierStaff
+from app.modules.order.model import Order
+from app.modules.supplier.model import Supplier
+from app.modules.user.model import User
+from tests.fixtures import bearer
 
 
-@pytest.mark.asyncio
 async def test_create_complaint_as_consumer(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that consumer can create a complaint."""
-    # Create consumer user
-    consumer_data = {
-        "email": "consumer_complaint@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    assert consumer_response.status_code == 201
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    # Create supplier owner
-    supplier_data = {
-        "email": "supplier_complaint@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
-    )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    # Create sales rep
-    sales_rep_data = {
-        "email": "salesrep_complaint@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {sales_rep_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
-    )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    # Create manager
-    manager_data = {
-        "email": "manager_complaint@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {manager_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
-    )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    # Create an order
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
-    )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    consumer, consumer_token = await make_consumer("consumer_complaint@example.com")
+    supplier, _ = await make_supplier("supplier_complaint@example.com")
+    sales_rep, _ = await make_staff(supplier, "salesrep_complaint@example.com")
+    manager, _ = await make_staff(supplier, "manager_complaint@example.com", "manager")
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order was delayed",
     }
 
     response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
 
     assert response.status_code == 201
     data = response.json()
     assert data["order_id"] == order.id
     assert data["consumer_id"] == consumer.id
-    assert data["sales_rep_id"] == sales_rep_user_id
-    assert data["manager_id"] == manager_user_id
+    assert data["sales_rep_id"] == sales_rep.id
+    assert data["manager_id"] == manager.id
     assert data["status"] == ComplaintStatus.OPEN.value
     assert data["description"] == "Order was delayed"
     assert data["resolution"] is None
 
 
-@pytest.mark.asyncio
 async def test_create_complaint_as_non_consumer_fails(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_user: Callable[..., Awaitable[tuple[User, str]]],
 ) -> None:
     """Test that non-consumers cannot create complaints."""
-    supplier_data = {
-        "email": "supplier_nocomplaint@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_token = supplier_response.json()["access_token"]
+    _, supplier_token = await make_user(
+        "supplier_nocomplaint@example.com", Role.SUPPLIER_OWNER.value
+    )
 
     complaint_data = {
         "order_id": 1,
@@ -162,24 +71,18 @@ async def test_create_complaint_as_non_consumer_fails(
     response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {supplier_token}"},
+        headers=bearer(supplier_token),
     )
 
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_create_complaint_invalid_order_fails(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
 ) -> None:
     """Test that creating a complaint with invalid order fails."""
-    consumer_data = {
-        "email": "consumer_invalid_order@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
+    _, consumer_token = await make_consumer("consumer_invalid_order@example.com")
 
     complaint_data = {
         "order_id": 99999,
@@ -191,121 +94,40 @@ async def test_create_complaint_invalid_order_fails(
     response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
 
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_update_complaint_status_open_to_escalated(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that sales rep can escalate a complaint."""
     # Setup: Create consumer, supplier, sales rep, manager, order, and complaint
-    consumer_data = {
-        "email": "consumer_escalate@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    supplier_data = {
-        "email": "supplier_escalate@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
+    consumer, consumer_token = await make_consumer("consumer_escalate@example.com")
+    supplier, _ = await make_supplier("supplier_escalate@example.com")
+    sales_rep, sales_rep_token = await make_staff(
+        supplier, "salesrep_escalate@example.com"
     )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    sales_rep_data = {
-        "email": "salesrep_escalate@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_token = sales_rep_response.json()["access_token"]
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {sales_rep_token}"},
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
-    )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    manager_data = {
-        "email": "manager_escalate@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {manager_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
-    )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
-    )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    manager, _ = await make_staff(supplier, "manager_escalate@example.com", "manager")
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order issue",
     }
     create_response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
     assert create_response.status_code == 201
     complaint_id = create_response.json()["id"]
@@ -316,122 +138,43 @@ async def test_update_complaint_status_open_to_escalated(
     response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {sales_rep_token}"},
+        headers=bearer(sales_rep_token),
     )
 
     assert response.status_code == 200
     assert response.json()["status"] == ComplaintStatus.ESCALATED.value
 
 
-@pytest.mark.asyncio
 async def test_update_complaint_status_escalated_to_resolved(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that manager can resolve an escalated complaint."""
     # Similar setup as above, but escalate first, then resolve
-    consumer_data = {
-        "email": "consumer_resolve@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    supplier_data = {
-        "email": "supplier_resolve@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
-    )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    sales_rep_data = {
-        "email": "salesrep_resolve@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {sales_rep_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
-    )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    manager_data = {
-        "email": "manager_resolve@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_token = manager_response.json()["access_token"]
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {manager_token}"},
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
+    consumer, consumer_token = await make_consumer("consumer_resolve@example.com")
+    supplier, _ = await make_supplier("supplier_resolve@example.com")
+    sales_rep, sales_rep_token = await make_staff(
+        supplier, "salesrep_resolve@example.com"
     )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
+    manager, manager_token = await make_staff(
+        supplier, "manager_resolve@example.com", "manager"
     )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order issue",
     }
     create_response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
     complaint_id = create_response.json()["id"]
 
@@ -440,9 +183,7 @@ async def test_update_complaint_status_escalated_to_resolved(
     await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={
-            "Authorization": f"Bearer {sales_rep_response.json()['access_token']}"
-        },
+        headers=bearer(sales_rep_token),
     )
 
     # Manager resolves
@@ -454,123 +195,45 @@ async def test_update_complaint_status_escalated_to_resolved(
     response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {manager_token}"},
+        headers=bearer(manager_token),
     )
 
     assert response.status_code == 200
-    assert response.json()["status"] == ComplaintStatus.RESOLVED.value
-    assert response.json()["resolution"] == "Issue has been resolved"
+    data = response.json()
+    assert data["status"] == ComplaintStatus.RESOLVED.value
+    assert data["resolution"] == "Issue has been resolved"
 
 
-@pytest.mark.asyncio
 async def test_update_complaint_status_invalid_transition_fails(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that invalid status transitions are rejected."""
     # Setup similar to above
-    consumer_data = {
-        "email": "consumer_invalid@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    supplier_data = {
-        "email": "supplier_invalid@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
+    consumer, consumer_token = await make_consumer("consumer_invalid@example.com")
+    supplier, _ = await make_supplier("supplier_invalid@example.com")
+    sales_rep, sales_rep_token = await make_staff(
+        supplier, "salesrep_invalid@example.com"
     )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    sales_rep_data = {
-        "email": "salesrep_invalid@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_token = sales_rep_response.json()["access_token"]
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {sales_rep_token}"},
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
+    manager, manager_token = await make_staff(
+        supplier, "manager_invalid@example.com", "manager"
     )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    manager_data = {
-        "email": "manager_invalid@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {manager_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
-    )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
-    )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order issue",
     }
     create_response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
     complaint_id = create_response.json()["id"]
 
@@ -579,13 +242,10 @@ async def test_update_complaint_status_invalid_transition_fails(
     escalate_response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {sales_rep_token}"},
+        headers=bearer(sales_rep_token),
     )
     assert escalate_response.status_code == 200
 
-    # Get manager token
-    manager_token = manager_response.json()["access_token"]
-
     # Resolve the complaint
     status_update = {
         "status": ComplaintStatus.RESOLVED.value,
@@ -594,7 +254,7 @@ async def test_update_complaint_status_invalid_transition_fails(
     resolve_response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {manager_token}"},
+        headers=bearer(manager_token),
     )
     assert resolve_response.status_code == 200
 
@@ -604,121 +264,40 @@ async def test_update_complaint_status_invalid_transition_fails(
     response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {sales_rep_token}"},
+        headers=bearer(sales_rep_token),
     )
 
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_resolve_complaint_requires_resolution_text(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that resolving a complaint requires resolution text."""
     # Setup similar to above
-    consumer_data = {
-        "email": "consumer_resolution@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    supplier_data = {
-        "email": "supplier_resolution@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
-    )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    sales_rep_data = {
-        "email": "salesrep_resolution@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {sales_rep_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
+    consumer, consumer_token = await make_consumer("consumer_resolution@example.com")
+    supplier, _ = await make_supplier("supplier_resolution@example.com")
+    sales_rep, _ = await make_staff(supplier, "salesrep_resolution@example.com")
+    manager, manager_token = await make_staff(
+        supplier, "manager_resolution@example.com", "manager"
     )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    manager_data = {
-        "email": "manager_resolution@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_token = manager_response.json()["access_token"]
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {manager_token}"},
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
-    )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
-    )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order issue",
     }
     create_response = await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
     complaint_id = create_response.json()["id"]
 
@@ -728,128 +307,44 @@ async def test_resolve_complaint_requires_resolution_text(
     response = await client.patch(
         f"/api/v1/complaints/{complaint_id}/status",
         json=status_update,
-        headers={"Authorization": f"Bearer {manager_token}"},
+        headers=bearer(manager_token),
     )
 
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_get_complaints_as_consumer(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    make_consumer: Callable[..., Awaitable[tuple[Consumer, str]]],
+    make_supplier: Callable[..., Awaitable[tuple[Supplier, str]]],
+    make_staff: Callable[..., Awaitable[tuple[User, str]]],
+    make_order: Callable[..., Awaitable[Order]],
 ) -> None:
     """Test that consumer can list their own complaints."""
     # Setup and create complaint (similar to above)
-    consumer_data = {
-        "email": "consumer_list@example.com",
-        "password": "password123",
-        "role": "consumer",
-    }
-    consumer_response = await client.post("/api/v1/auth/signup", json=consumer_data)
-    consumer_token = consumer_response.json()["access_token"]
-    consumer_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={"Authorization": f"Bearer {consumer_token}"},
-        )
-    ).json()["id"]
-    consumer = Consumer(user_id=consumer_user_id, organization_name="Test Consumer")
-    db_session.add(consumer)
-    await db_session.commit()
-    await db_session.refresh(consumer)
-
-    supplier_data = {
-        "email": "supplier_list@example.com",
-        "password": "password123",
-        "role": "supplier_owner",
-    }
-    supplier_response = await client.post("/api/v1/auth/signup", json=supplier_data)
-    supplier_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {supplier_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    supplier = Supplier(
-        user_id=supplier_user_id, company_name="Test Supplier", is_active=True
-    )
-    db_session.add(supplier)
-    await db_session.commit()
-    await db_session.refresh(supplier)
-
-    sales_rep_data = {
-        "email": "salesrep_list@example.com",
-        "password": "password123",
-        "role": "supplier_sales",
-    }
-    sales_rep_response = await client.post("/api/v1/auth/signup", json=sales_rep_data)
-    sales_rep_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {sales_rep_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    sales_rep_staff = SupplierStaff(
-        user_id=sales_rep_user_id,
-        supplier_id=supplier.id,
-        staff_role="sales",
-    )
-    db_session.add(sales_rep_staff)
-    await db_session.commit()
-
-    manager_data = {
-        "email": "manager_list@example.com",
-        "password": "password123",
-        "role": "supplier_manager",
-    }
-    manager_response = await client.post("/api/v1/auth/signup", json=manager_data)
-    manager_user_id = (
-        await client.get(
-            "/api/v1/users/me",
-            headers={
-                "Authorization": f"Bearer {manager_response.json()['access_token']}"
-            },
-        )
-    ).json()["id"]
-    manager_staff = SupplierStaff(
-        user_id=manager_user_id,
-        supplier_id=supplier.id,
-        staff_role="manager",
-    )
-    db_session.add(manager_staff)
-    await db_session.commit()
-
-    order = Order(
-        supplier_id=supplier.id,
-        consumer_id=consumer.id,
-        status=OrderStatus.PENDING,
-        total_kzt=1000.00,
-    )
-    db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    consumer, consumer_token = await make_consumer("consumer_list@example.com")
+    supplier, _ = await make_supplier("supplier_list@example.com")
+    sales_rep, _ = await make_staff(supplier, "salesrep_list@example.com")
+    manager, _ = await make_staff(supplier, "manager_list@example.com", "manager")
+    order = await make_order(consumer, supplier)
 
     # Create complaint
     complaint_data = {
         "order_id": order.id,
-        "sales_rep_id": sales_rep_user_id,
-        "manager_id": manager_user_id,
+        "sales_rep_id": sales_rep.id,
+        "manager_id": manager.id,
         "description": "Order issue",
     }
     await client.post(
         "/api/v1/complaints",
         json=complaint_data,
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
 
     # List complaints
     response = await client.get(
         "/api/v1/complaints",
-        headers={"Authorization": f"Bearer {consumer_token}"},
+        headers=bearer(consumer_token),
     )
 
     assert response.status_code == 200
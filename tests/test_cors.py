@@ -1,10 +1,8 @@
 """CORS configuration tests."""
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_cors_allowed_origin(client: AsyncClient) -> None:
     """Test that allowed CORS origins are accepted."""
     # Test with an allowed origin
@@ -20,7 +18,6 @@ async def test_cors_allowed_origin(client: AsyncClient) -> None:
     # but we can verify the endpoint works
 
 
-@pytest.mark.asyncio
 async def test_cors_preflight_request(client: AsyncClient) -> None:
     """Test CORS preflight OPTIONS request."""
     response = await client.options(
@@ -35,7 +32,6 @@ async def test_cors_preflight_request(client: AsyncClient) -> None:
     assert response.status_code in [200, 204]
 
 
-@pytest.mark.asyncio
 async def test_health_endpoint_with_cors(client: AsyncClient) -> None:
     """Test health endpoint works with CORS headers."""
     response = await client.get(
@@ -1,6 +1,5 @@
 """Database session tests."""
 
-import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -20,7 +19,6 @@ def test_get_db_return_type():
     )
 
 
-@pytest.mark.asyncio
 async def test_get_db_provides_session():
     """Test that get_db yields an AsyncSession."""
     async for session in get_db():
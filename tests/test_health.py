@@ -1,10 +1,8 @@
 """Health check endpoint tests."""
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_health_check(client: AsyncClient) -> None:
     """Test health check endpoint returns correct response."""
     response = await client.get("/api/v1/health")
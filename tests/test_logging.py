@@ -2,10 +2,24 @@
 
 import json
 import logging
+from collections.abc import Generator
+from uuid import uuid4
+
+import pytest
 
 from app.core.logging import JSONFormatter, setup_logging
 
 
+@pytest.fixture
+def isolated_logger() -> Generator[logging.Logger]:
+    """Provide a throwaway logger so tests don't reconfigure the root logger."""
+    logger = logging.getLogger(f"test_logging_{uuid4().hex}")
+    yield logger
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
 def test_json_formatter():
     """Test JSON formatter produces valid JSON."""
     formatter = JSONFormatter()
@@ -28,16 +42,11 @@ def test_json_formatter():
     assert "timestamp" in parsed
 
 
-def test_logging_dev_mode(capsys):
+def test_logging_dev_mode(capsys, isolated_logger):
     """Test that dev mode uses human-readable format."""
-    # Clear existing handlers
-    root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    setup_logging("INFO", "dev", logger=isolated_logger)
 
-    setup_logging("INFO", "dev")
-
-    logger = logging.getLogger("test")
-    logger.info("Test message")
+    isolated_logger.info("Test message")
 
     # Capture stdout
     captured = capsys.readouterr()
@@ -49,16 +58,11 @@ def test_logging_dev_mode(capsys):
     assert not output.strip().startswith("{")
 
 
-def test_logging_production_mode(capsys):
+def test_logging_production_mode(capsys, isolated_logger):
     """Test that production mode uses JSON format."""
-    # Clear existing handlers
-    root_logger = logging.getLogger()
-    root_logger.handlers.clear()
-
-    setup_logging("INFO", "production")
+    setup_logging("INFO", "production", logger=isolated_logger)
 
-    logger = logging.getLogger("test")
-    logger.info("Test message")
+    isolated_logger.info("Test message")
 
     # Capture stdout
     captured = capsys.readouterr()
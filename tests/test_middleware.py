@@ -2,22 +2,41 @@
 
 import logging
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
+class _RequestLogCapture(logging.Handler):
+    """Keep only the middleware's request log records."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "Request" in record.getMessage():
+            self.records.append(record)
+
+
 async def test_structured_logging_middleware_logs_request_info(
-    client: AsyncClient, caplog
+    client: AsyncClient,
 ) -> None:
     """Test that structured logging middleware logs method, path, status, latency."""
-    with caplog.at_level(logging.INFO):
+    # Listen on the middleware logger only, rather than capturing every record
+    middleware_logger = logging.getLogger("app.core.middleware")
+    capture = _RequestLogCapture()
+    previous_level = middleware_logger.level
+    middleware_logger.addHandler(capture)
+    middleware_logger.setLevel(logging.INFO)
+    try:
         response = await client.get("/api/v1/health")
+    finally:
+        middleware_logger.removeHandler(capture)
+        middleware_logger.setLevel(previous_level)
 
     assert response.status_code == 200
 
     # Check that logs contain request information
-    log_records = [record for record in caplog.records if "Request" in record.message]
+    log_records = capture.records
 
     # Should have at least "Request started" and "Request completed" logs
     assert len(log_records) >= 2
@@ -25,17 +44,15 @@ async def test_structured_logging_middleware_logs_request_info(
     # Find the "Request completed" log
     completed_log = None
     for record in log_records:
-        if "Request completed" in record.message:
+        if "Request completed" in record.getMessage():
             completed_log = record
             break
 
     assert completed_log is not None, "Request completed log not found"
 
     # Check that it has the required fields in extra
-    assert hasattr(completed_log, "method")
-    assert hasattr(completed_log, "path")
-    assert hasattr(completed_log, "status_code")
-    assert hasattr(completed_log, "latency_ms")
+    required_fields = {"method", "path", "status_code", "latency_ms"}
+    assert required_fields <= completed_log.__dict__.keys()
 
     # Verify values
     assert completed_log.method == "GET"
@@ -1,10 +1,11 @@
 """Tests for observability features (health checks, logging, correlation IDs)."""
 
+import uuid
+
 import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_health_check_with_db_ok(client: AsyncClient) -> None:
     """Test health check endpoint returns ok when database is healthy."""
@@ -17,7 +18,6 @@ async def test_health_check_with_db_ok(client: AsyncClient) -> None:
     assert "env" in data
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_health_check_includes_correlation_id(client: AsyncClient) -> None:
     """Test that health check response includes correlation ID header."""
@@ -28,7 +28,6 @@ async def test_health_check_includes_correlation_id(client: AsyncClient) -> None
     assert len(response.headers["X-Correlation-ID"]) > 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_correlation_id_passed_in_request(client: AsyncClient) -> None:
     """Test that custom correlation ID from request is preserved."""
@@ -42,7 +41,6 @@ async def test_correlation_id_passed_in_request(client: AsyncClient) -> None:
     assert response.headers["X-Correlation-ID"] == custom_correlation_id
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_correlation_id_generated_if_missing(client: AsyncClient) -> None:
     """Test that correlation ID is generated if not provided in request."""
@@ -50,13 +48,11 @@ async def test_correlation_id_generated_if_missing(client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert "X-Correlation-ID" in response.headers
-    # Should be a UUID format (36 characters with hyphens)
+    # Should be a UUID in canonical form (UUID() raises on malformed input)
     correlation_id = response.headers["X-Correlation-ID"]
-    assert len(correlation_id) == 36
-    assert correlation_id.count("-") == 4
+    assert str(uuid.UUID(correlation_id)) == correlation_id
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_error_logging_includes_correlation_id(
     client: AsyncClient,
@@ -70,22 +66,21 @@ async def test_error_logging_includes_correlation_id(
     assert "X-Correlation-ID" in response.headers
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_health_check_with_db_degraded(
     client: AsyncClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test health check shows degraded status when database is unavailable."""
-    # Mock database connection to simulate outage
-    from app.api import main
+    class UnreachableEngine:
+        """Engine stand-in whose connections fail like a server that is down."""
 
-    async def mock_db_check() -> str:
-        """Simulate database failure."""
-        raise ConnectionError("Database connection failed")
+        def connect(self):
+            raise ConnectionRefusedError("database unavailable")
 
-    # Patch the health check function to simulate DB outage
-    monkeypatch.setattr(main, "check_database_health", mock_db_check)
+    # Swap the engine the real health check connects with, so the check's own
+    # error handling turns the failure into "error"
+    monkeypatch.setattr("app.api.main.engine", UnreachableEngine())
 
     response = await client.get("/health")
 
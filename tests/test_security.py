@@ -1,7 +1,9 @@
 """Security and authentication tests."""
 
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import timedelta
 
+from app.core import security
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
@@ -100,6 +102,38 @@ class TestJWTTokens:
         assert decoded["email"] == original_data["email"]
         assert decoded["custom"] == original_data["custom"]
 
+    def test_decode_access_token_reuses_cached_payload(self, monkeypatch):
+        """Test that a repeated access token is verified only once."""
+        token = create_access_token(
+            {"sub": 7, "custom": "cached"}, scopes=["read:orders"]
+        )
+        calls = []
+        real_decode = security._token_decoder.decode
+
+        def counting_decode(*args, **kwargs):
+            calls.append(args[0])
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(security._token_decoder, "decode", counting_decode)
+        first = decode_access_token(token)
+        first["custom"] = "mutated"
+        first["scopes"].append("write:orders")
+        second = decode_access_token(token)
+        second["scopes"].append("write:products")
+        third = decode_access_token(token)
+        assert calls == [token]
+        assert third["sub"] == 7
+        assert third["custom"] == "cached"
+        assert third["scopes"] == ["read:orders"]
+
+    def test_decode_access_token_cache_ignored_after_key_rotation(self, monkeypatch):
+        """Test that a cached payload is not reused once SECRET_KEY changes."""
+        token = create_access_token({"sub": 8, "custom": "rotated"})
+        assert decode_access_token(token) is not None
+
+        monkeypatch.setattr(settings, "SECRET_KEY", "rotated-secret-key-for-tests")
+        assert decode_access_token(token) is None
+
     def test_create_refresh_token_returns_string(self):
         """Test that create_refresh_token returns a string."""
         data = {"sub": 1}
@@ -148,13 +182,8 @@ class TestJWTTokens:
 
         # Check expiration is approximately correct (within 1 minute)
         # JWT exp is Unix timestamp (int)
-        exp_timestamp = decoded["exp"]
-        expected_exp = datetime.now(UTC) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-        expected_timestamp = int(expected_exp.timestamp())
-        time_diff = abs(exp_timestamp - expected_timestamp)
-        assert time_diff < 60  # Within 1 minute
+        expected_timestamp = time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        assert abs(decoded["exp"] - expected_timestamp) < 60
 
     def test_refresh_token_uses_settings_expiry(self):
         """Test that refresh token uses expiry from settings."""
@@ -165,10 +194,5 @@ class TestJWTTokens:
 
         # Check expiration is approximately correct (within 1 minute)
         # JWT exp is Unix timestamp (int)
-        exp_timestamp = decoded["exp"]
-        expected_exp = datetime.now(UTC) + timedelta(
-            minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES
-        )
-        expected_timestamp = int(expected_exp.timestamp())
-        time_diff = abs(exp_timestamp - expected_timestamp)
-        assert time_diff < 60  # Within 1 minute
+        expected_timestamp = time.time() + settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
+        assert abs(decoded["exp"] - expected_timestamp) < 60
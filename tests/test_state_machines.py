@@ -5,43 +5,24 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_order_status_transition_pending_to_accepted(
+@pytest.mark.parametrize("target_status", ["accepted", "rejected"])
+async def test_order_status_transition_from_pending(
     client: AsyncClient,
     order,
     auth_headers_supplier_owner: dict[str, str],
-    db_session: AsyncSession,
+    target_status: str,
 ) -> None:
-    """Test order status transition from PENDING to ACCEPTED."""
-    # Update order status
+    """Test order status transitions out of PENDING."""
     response = await client.patch(
         f"/api/v1/orders/{order.id}/status",
-        json={"status": "accepted"},
-        headers=auth_headers_supplier_owner,
-    )
-    assert response.status_code == 200
-    assert response.json()["status"] == "accepted"
-
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-async def test_order_status_transition_pending_to_rejected(
-    client: AsyncClient,
-    order,
-    auth_headers_supplier_owner: dict[str, str],
-) -> None:
-    """Test order status transition from PENDING to REJECTED."""
-    response = await client.patch(
-        f"/api/v1/orders/{order.id}/status",
-        json={"status": "rejected"},
+        json={"status": target_status},
         headers=auth_headers_supplier_owner,
     )
     assert response.status_code == 200
-    assert response.json()["status"] == "rejected"
+    assert response.json()["status"] == target_status
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_order_status_transition_accepted_to_in_progress(
     client: AsyncClient,
@@ -67,7 +48,6 @@ async def test_order_status_transition_accepted_to_in_progress(
     assert response.json()["status"] == "in_progress"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_order_status_transition_invalid_from_rejected(
     client: AsyncClient,
@@ -92,41 +72,24 @@ async def test_order_status_transition_invalid_from_rejected(
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_link_status_transition_pending_to_accepted(
+@pytest.mark.parametrize("target_status", ["accepted", "denied"])
+async def test_link_status_transition_from_pending(
     client: AsyncClient,
     pending_link,
     auth_headers_supplier_owner: dict[str, str],
+    target_status: str,
 ) -> None:
-    """Test link status transition from PENDING to ACCEPTED."""
+    """Test link status transitions out of PENDING."""
     response = await client.patch(
         f"/api/v1/links/{pending_link.id}/status",
-        json={"status": "accepted"},
-        headers=auth_headers_supplier_owner,
-    )
-    assert response.status_code == 200
-    assert response.json()["status"] == "accepted"
-
-
-@pytest.mark.asyncio
-@pytest.mark.integration
-async def test_link_status_transition_pending_to_denied(
-    client: AsyncClient,
-    pending_link,
-    auth_headers_supplier_owner: dict[str, str],
-) -> None:
-    """Test link status transition from PENDING to DENIED."""
-    response = await client.patch(
-        f"/api/v1/links/{pending_link.id}/status",
-        json={"status": "denied"},
+        json={"status": target_status},
         headers=auth_headers_supplier_owner,
     )
     assert response.status_code == 200
-    assert response.json()["status"] == "denied"
+    assert response.json()["status"] == target_status
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_link_status_transition_accepted_to_blocked(
     client: AsyncClient,
@@ -143,7 +106,6 @@ async def test_link_status_transition_accepted_to_blocked(
     assert response.json()["status"] == "blocked"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_link_status_transition_denied_to_pending(
     client: AsyncClient,
@@ -169,7 +131,6 @@ async def test_link_status_transition_denied_to_pending(
     assert response.json()["status"] == "pending"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_complaint_status_transition_open_to_escalated(
     client: AsyncClient,
@@ -186,7 +147,6 @@ async def test_complaint_status_transition_open_to_escalated(
     assert response.json()["status"] == "escalated"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_complaint_status_transition_open_to_resolved(
     client: AsyncClient,
@@ -203,11 +163,11 @@ async def test_complaint_status_transition_open_to_resolved(
         headers=auth_headers_supplier_manager,
     )
     assert response.status_code == 200
-    assert response.json()["status"] == "resolved"
-    assert response.json()["resolution"] == "Issue has been resolved"
+    data = response.json()
+    assert data["status"] == "resolved"
+    assert data["resolution"] == "Issue has been resolved"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_complaint_status_transition_resolved_requires_resolution(
     client: AsyncClient,
@@ -224,7 +184,6 @@ async def test_complaint_status_transition_resolved_requires_resolution(
     assert "resolution" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_complaint_status_transition_resolved_cannot_change(
     client: AsyncClient,